@@ -7,16 +7,17 @@ Check and clone tracked repositories from config.json to output directories
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import common utilities
 from common import (
     read_config, 
     ensure_directory, 
-    run_command, 
     get_project_root,
     setup_logging
 )
+from github_client import GitHubClient
 
 # Setup logger
 logger = setup_logging("check_pull_repo")
@@ -59,42 +60,6 @@ def create_output_dirs(project_root, repositories, config):
     
     return repo_dirs
 
-def clone_repository(repo, repo_dir, skip_clone=False):
-    """
-    Clone or pull the repository
-    
-    Args:
-        repo: Repository name (owner/repo)
-        repo_dir: Directory to clone the repository into
-        skip_clone: If True, skip the actual clone/pull operation
-        
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    if skip_clone:
-        logger.info(f"Skipping clone/pull for repository: {repo}")
-        return True
-        
-    try:
-        if repo_dir.exists() and (repo_dir / ".git").exists():
-            # Repository already exists, pull latest changes
-            logger.info(f"Updating existing repository: {repo}")
-            cmd = f"cd {repo_dir} && git pull"
-            run_command(cmd)
-        else:
-            # Clone the repository
-            logger.info(f"Cloning repository: {repo}")
-            cmd = f"git clone https://github.com/{repo}.git {repo_dir}"
-            run_command(cmd, timeout=300)  # Longer timeout for cloning
-        
-        return True
-    except TimeoutError as e:
-        logger.error(f"Timeout error with repository {repo}: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error with repository {repo}: {e}")
-        return False
-
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Check and clone tracked repositories')
@@ -141,11 +106,24 @@ def main():
     # Create output directories
     repo_dirs = create_output_dirs(project_root, repositories, config)
     
-    # Clone/pull repositories
-    success_count = 0
-    for repo, repo_dir in repo_dirs.items():
-        if clone_repository(repo, repo_dir, args.skip_clone):
-            success_count += 1
+    # Shallow clones are used unless disabled in the configuration
+    shallow = config['github'].get('shallow_clone', True)
+    
+    # Repositories updated within this many seconds are not pulled again, 0 always pulls
+    pull_ttl = config['github'].get('pull_ttl', 0)
+    
+    # Clone/pull repositories concurrently, the work is dominated by network I/O
+    github_client = GitHubClient()
+    with ThreadPoolExecutor(max_workers=min(16, len(repo_dirs))) as executor:
+        results = list(executor.map(
+            lambda item: github_client.clone_repository(item[0], item[1], args.skip_clone, shallow, pull_ttl),
+            repo_dirs.items()
+        ))
+    success_count = sum(results)
+    
+    for repo, success in zip(repo_dirs, results):
+        if not success:
+            logger.error(f"Failed to clone/pull repository: {repo}")
     
     logger.info(f"\nSuccessfully processed {success_count} out of {len(repositories)} repositories")
 
@@ -6,19 +6,26 @@ Common utilities for PRhythm scripts.
 This module contains shared functionality used across multiple scripts in the PRhythm project.
 """
 
-import json
 import os
 import sys
 import logging
 import subprocess
 import time
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+# File helpers are shared with the utils package
+from utils.file_utils import ensure_directory, get_project_root, load_json, save_json
+
 # Setup global logger
 logger = logging.getLogger("PRhythm")
 
+# Patterns for repositories given as owner/repo or as a GitHub URL
+OWNER_REPO_PATTERN = re.compile(r'^[^/]+/[^/]+$')
+GITHUB_URL_PATTERN = re.compile(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$')
+
 def setup_logging(script_name, log_level=logging.INFO, log_to_file=True):
     """
     Setup standardized logging for scripts
@@ -64,6 +71,9 @@ def read_config(config_path):
     """
     Read configuration file and return its contents
     
+    The parsed configuration is cached per path and modification time,
+    callers must treat it as read-only.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -74,35 +84,21 @@ def read_config(config_path):
         RuntimeError: If the configuration file cannot be read
     """
     try:
-        with open(config_path, 'r') as file:
-            config = json.load(file)
-            return config
-    except Exception as e:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError as e:
         raise RuntimeError(f"Error reading configuration file: {e}")
-
-def get_project_root():
-    """
-    Get project root directory
     
-    Returns:
-        Path: Project root directory
-    """
-    script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-    return script_dir.parent
+    return _read_config_cached(str(config_path), mtime_ns)
 
-def ensure_directory(directory_path):
+@lru_cache(maxsize=8)
+def _read_config_cached(config_path, mtime_ns):
     """
-    Ensure that a directory exists, creating it if necessary
-    
-    Args:
-        directory_path: Path to the directory
-        
-    Returns:
-        Path: Path to the directory
+    Read and parse a configuration file, see read_config
     """
-    directory = Path(directory_path)
-    directory.mkdir(parents=True, exist_ok=True)
-    return directory
+    try:
+        return load_json(config_path)
+    except Exception as e:
+        raise RuntimeError(f"Error reading configuration file: {e}")
 
 def run_command(cmd, timeout=60, check=True, capture_output=True):
     """
@@ -177,10 +173,10 @@ def validate_repo_url(repo_url):
     Raises:
         ValueError: If the repository URL is invalid
     """
-    if re.match(r'^[^/]+/[^/]+$', repo_url):
+    if OWNER_REPO_PATTERN.match(repo_url):
         return repo_url
     
-    match = re.search(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$', repo_url)
+    match = GITHUB_URL_PATTERN.search(repo_url)
     if match:
         return match.group(1)
     
@@ -209,40 +205,3 @@ def get_path_from_config(config, path_key, default_path, project_root=None):
         path = project_root / path
         
     return path
-
-def save_json(data, file_path, indent=2):
-    """
-    Save data to a JSON file
-    
-    Args:
-        data: Data to save
-        file_path: Path to the file
-        indent: JSON indentation (default: 2)
-        
-    Returns:
-        Path: Path to the saved file
-    """
-    file_path = Path(file_path)
-    ensure_directory(file_path.parent)
-    
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=indent)
-        
-    return file_path
-
-def load_json(file_path):
-    """
-    Load data from a JSON file
-    
-    Args:
-        file_path: Path to the file
-        
-    Returns:
-        dict: Loaded data
-        
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
-    """
-    with open(file_path, 'r') as f:
-        return json.load(f) 
\ No newline at end of file
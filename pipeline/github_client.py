@@ -8,17 +8,29 @@ This module provides functions for interacting with GitHub API and CLI.
 
 import json
 import logging
+import re
 import subprocess
+import time
 import requests
-import re
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+from common import retry_operation, validate_repo_url
 from utils.file_utils import ensure_directory
 
 # Setup logger
 logger = logging.getLogger("github_client")
 
+# gh error output of transient failures that are worth retrying
+TRANSIENT_GH_ERROR_PATTERN = re.compile(
+    r'rate limit|abuse|HTTP 5\d\d|timeout|timed out|connection reset|connection refused|could not resolve host',
+    re.IGNORECASE
+)
+
+# Marker file inside .git whose modification time records the last successful clone/pull
+LAST_FETCH_MARKER = "prhythm_last_fetch"
+
 class GitHubClient:
     """
     Client for interacting with GitHub API and CLI.
@@ -38,8 +50,14 @@ class GitHubClient:
         
         if token:
             self.headers["Authorization"] = f"token {token}"
+        
+        # Reuse connections across API requests
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.headers.update(self.headers)
     
-    def validate_repo_url(self, repo_url: str) -> str:
+    @staticmethod
+    def validate_repo_url(repo_url: str) -> str:
         """
         Validate and normalize repository URL to owner/repo format
         
@@ -52,21 +70,14 @@ class GitHubClient:
         Raises:
             ValueError: If the repository URL is invalid
         """
-        if re.match(r'^[^/]+/[^/]+$', repo_url):
-            return repo_url
-        
-        match = re.search(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$', repo_url)
-        if match:
-            return match.group(1)
-        
-        raise ValueError(f"Invalid repository format: {repo_url}. Expected format: owner/repo or GitHub URL")
+        return validate_repo_url(repo_url)
     
-    def run_gh_command(self, command: str, timeout: int = 60) -> Tuple[int, str, str]:
+    def run_gh_command(self, command: Union[str, List[str]], timeout: int = 60) -> Tuple[int, str, str]:
         """
         Run a GitHub CLI command
         
         Args:
-            command: Command to run
+            command: Command to run (shell string or argument list)
             timeout: Timeout in seconds
             
         Returns:
@@ -80,7 +91,7 @@ class GitHubClient:
             # Execute command
             process = subprocess.Popen(
                 command,
-                shell=True,
+                shell=isinstance(command, str),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -95,6 +106,36 @@ class GitHubClient:
             process.kill()
             raise
     
+    def _run_gh_command_with_retry(self, command: Union[str, List[str]], timeout: int = 60,
+                                   max_retries: int = 4, retry_delay: float = 2) -> Tuple[int, str, str]:
+        """
+        Run a GitHub CLI command, retrying transient failures with exponential backoff
+        
+        Rate limits, GitHub server errors and network failures are retried, other
+        failures such as a missing PR are returned immediately.
+        
+        Args:
+            command: Command to run (shell string or argument list)
+            timeout: Timeout in seconds per attempt
+            max_retries: Maximum number of attempts (default: 4)
+            retry_delay: Initial retry delay in seconds (default: 2)
+            
+        Returns:
+            tuple: (return_code, stdout, stderr)
+            
+        Raises:
+            RuntimeError: If the command still fails transiently after all attempts
+            subprocess.TimeoutExpired: If the last attempt times out
+        """
+        def attempt() -> Tuple[int, str, str]:
+            returncode, stdout, stderr = self.run_gh_command(command, timeout)
+            if returncode != 0 and TRANSIENT_GH_ERROR_PATTERN.search(stderr or ""):
+                raise RuntimeError(stderr.strip())
+            return returncode, stdout, stderr
+        
+        return retry_operation(attempt, max_retries, retry_delay,
+                               exceptions=(RuntimeError, subprocess.TimeoutExpired))
+    
     def fetch_pr_info(self, repo: str, pr_number: Union[int, str]) -> Dict[str, Any]:
         """
         Fetch PR information using GitHub CLI
@@ -116,8 +157,11 @@ class GitHubClient:
             # Fetch basic PR info - removed commits and comments from the JSON fields
             logger.info(f"Fetching PR information for {repo}#{pr_number}")
             
-            cmd = f"gh pr view {pr_number} --repo {repo} --json number,title,url,state,author,createdAt,mergedAt,mergedBy,body,files,reviews,labels"
-            returncode, stdout, stderr = self.run_gh_command(cmd)
+            cmd = [
+                "gh", "pr", "view", str(pr_number), "--repo", repo,
+                "--json", "number,title,url,state,author,createdAt,mergedAt,mergedBy,body,files,reviews,labels"
+            ]
+            returncode, stdout, stderr = self._run_gh_command_with_retry(cmd)
             
             if returncode != 0:
                 raise RuntimeError(f"Error fetching PR information: {stderr}")
@@ -157,8 +201,8 @@ class GitHubClient:
             # Fetch PR diff
             logger.info(f"Fetching PR diff for {repo}#{pr_number}")
             
-            cmd = f"gh pr diff {pr_number} --repo {repo}"
-            returncode, stdout, stderr = self.run_gh_command(cmd)
+            cmd = ["gh", "pr", "diff", str(pr_number), "--repo", repo]
+            returncode, stdout, stderr = self._run_gh_command_with_retry(cmd)
             
             if returncode != 0:
                 raise RuntimeError(f"Error fetching PR diff: {stderr}")
@@ -187,7 +231,7 @@ class GitHubClient:
             logger.info(f"Fetching merged PRs for {repo} (limit: {limit})")
             
             url = f"{self.api_base_url}/repos/{repo}/pulls?state=closed&sort=updated&direction=desc&per_page={limit}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             # Filter to only merged PRs
@@ -205,7 +249,8 @@ class GitHubClient:
             logger.error(f"Unexpected error fetching merged PRs for {repo}: {e}")
             return []
     
-    def clone_repository(self, repo: str, target_dir: Union[str, Path], skip_clone: bool = False) -> bool:
+    def clone_repository(self, repo: str, target_dir: Union[str, Path], skip_clone: bool = False,
+                         shallow: bool = True, pull_ttl: int = 0) -> bool:
         """
         Clone or pull a repository
         
@@ -213,6 +258,9 @@ class GitHubClient:
             repo: Repository name (owner/repo)
             target_dir: Directory to clone the repository into
             skip_clone: If True, skip the actual clone/pull operation
+            shallow: If True, only fetch the latest commit without its history
+            pull_ttl: Skip the pull if the repository was updated less than this many
+                seconds ago (default: 0, always pull)
             
         Returns:
             bool: True if successful, False otherwise
@@ -229,22 +277,50 @@ class GitHubClient:
             target_dir = Path(target_dir)
             ensure_directory(target_dir.parent)
             
+            last_fetch_marker = target_dir / ".git" / LAST_FETCH_MARKER
+            
             if target_dir.exists() and (target_dir / ".git").exists():
+                # Skip the network round-trip if the repository was updated recently
+                if pull_ttl:
+                    try:
+                        if time.time() - last_fetch_marker.stat().st_mtime < pull_ttl:
+                            logger.info(f"Repository {repo} updated less than {pull_ttl} seconds ago, skipping pull")
+                            return True
+                    except FileNotFoundError:
+                        pass
+                
                 # Repository already exists, pull latest changes
                 logger.info(f"Updating existing repository: {repo}")
-                cmd = f"cd {target_dir} && git pull"
+                if shallow:
+                    # Move the checkout to the latest commit without fetching history
+                    cmds = [
+                        ["git", "-C", str(target_dir), "fetch", "--depth=1", "origin", "HEAD"],
+                        ["git", "-C", str(target_dir), "reset", "--hard", "FETCH_HEAD"]
+                    ]
+                else:
+                    cmds = [["git", "-C", str(target_dir), "pull"]]
             else:
                 # Clone the repository
                 logger.info(f"Cloning repository: {repo}")
-                cmd = f"git clone https://github.com/{repo}.git {target_dir}"
-            
-            # Run command
-            returncode, stdout, stderr = self.run_gh_command(cmd, timeout=300)
-            
-            if returncode != 0:
-                logger.error(f"Error with repository {repo}: {stderr}")
-                return False
-            
+                cmd = ["git", "clone"]
+                if shallow:
+                    # Only the latest file contents are used, skip the history
+                    cmd += ["--depth=1", "--filter=blob:none", "--single-branch"]
+                cmd += [f"https://github.com/{repo}.git", str(target_dir)]
+                cmds = [cmd]
+            
+            # Run commands
+            for cmd in cmds:
+                returncode, stdout, stderr = self.run_gh_command(cmd, timeout=300)
+                
+                if returncode != 0:
+                    logger.error(f"Error with repository {repo}: {stderr}")
+                    return False
+            
+            try:
+                last_fetch_marker.touch()
+            except OSError as e:
+                logger.warning(f"Could not record update time of repository {repo}: {e}")
             return True
         except subprocess.TimeoutExpired:
             logger.error(f"Timeout error with repository {repo}")
@@ -6,18 +6,23 @@ PR Analyzer for PRhythm.
 This module analyzes PR content using LLM and generates reports.
 """
 
+import json
 import logging
 import os
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import time
+from datetime import datetime
 
 from providers.provider_factory import get_provider_from_config
 from utils.config_manager import config_manager
-from utils.file_utils import load_json, save_text, generate_output_path
+from utils.file_utils import load_json, save_text, generate_output_path, find_latest_pr_json
 from utils.languages import is_supported_language, get_language_name
+from utils.response_cache import ResponseCache, DEFAULT_TTL
 from prompt_builder import PromptBuilder
 
 # Setup logger
@@ -28,12 +33,13 @@ class PRAnalyzer:
     Analyzes PR content using LLM and generates reports.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, use_cache: bool = True):
         """
         Initialize PR analyzer
         
         Args:
             config: Configuration dictionary (optional)
+            use_cache: Whether to reuse cached LLM responses (default: True)
         """
         self.config = config or config_manager.get_full_config()
         self.prompt_builder = PromptBuilder()
@@ -41,12 +47,19 @@ class PRAnalyzer:
         # Initialize LLM provider
         self.provider = get_provider_from_config(self.config)
         
+        # Reuse responses for prompts that were already analyzed, a TTL of 0 disables the cache
+        cache_ttl = self.config.get("llm", {}).get("cache_ttl", DEFAULT_TTL)
+        self.response_cache = None
+        if use_cache and cache_ttl:
+            self.response_cache = ResponseCache(config_manager.get_cache_dir() / "llm", cache_ttl)
+        
         # Get configured languages
         self.languages = config_manager.get_output_languages()
     
     def analyze_pr(self, pr_data: Dict[str, Any], language: str = "en", 
                   output_dir: Optional[Path] = None, save_diff: bool = False,
-                  dry_run: bool = False, save_prompt: bool = False) -> Dict[str, Any]:
+                  dry_run: bool = False, save_prompt: bool = False,
+                  timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Analyze PR and generate report
         
@@ -57,6 +70,7 @@ class PRAnalyzer:
             save_diff: Whether to save PR diff as a separate file
             dry_run: If True, don't actually call LLM API
             save_prompt: Whether to save the LLM prompt
+            timestamp: Date used to name the output files (default: now)
             
         Returns:
             dict: Analysis result
@@ -94,8 +108,8 @@ class PRAnalyzer:
         if save_prompt:
             logs_dir = Path("logs")
             logs_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = int(time.time())
-            prompt_filename = f"prompt_{repo.replace('/', '-')}_{pr_number}_{language}_{timestamp}.log"
+            prompt_ts = int(time.time())
+            prompt_filename = f"prompt_{repo.replace('/', '-')}_{pr_number}_{language}_{prompt_ts}.log"
             prompt_path = logs_dir / prompt_filename
             try:
                 save_text(prompt, prompt_path)
@@ -112,7 +126,14 @@ class PRAnalyzer:
         # Call LLM API to generate analysis
         logger.info(f"Generating analysis for {repo}#{pr_number} in {language}")
         try:
-            analysis = self.provider.get_completion(prompt)
+            # Small PRs can be routed to a cheaper, faster model
+            total_changes = sum(
+                file.get("additions", 0) + file.get("deletions", 0)
+                for file in pr_data.get("files", [])
+            )
+            model = self.provider.select_model(total_changes)
+            
+            analysis = self._get_completion(prompt, model)
             result["analysis"] = analysis
             
             # Get analysis directory for saving MD files
@@ -120,8 +141,12 @@ class PRAnalyzer:
             
             # Save analysis to file if output directory is provided
             if output_dir:
+                # Name the report and the diff after the same date
+                timestamp = timestamp or datetime.now()
+                
                 # Save analysis as markdown file in analysis_dir
-                analysis_path = generate_output_path(analysis_dir, repo, pr_number, "md", language)
+                analysis_path = generate_output_path(analysis_dir, repo, pr_number, "md", language,
+                                                     timestamp=timestamp)
                 save_text(analysis, analysis_path)
                 result["analysis_path"] = str(analysis_path)
                 
@@ -129,7 +154,8 @@ class PRAnalyzer:
                 if save_diff:
                     diff = pr_data.get("diff", "")
                     if diff:
-                        diff_path = generate_output_path(analysis_dir, repo, pr_number, "patch", None, True)
+                        diff_path = generate_output_path(analysis_dir, repo, pr_number, "patch", None, True,
+                                                         timestamp)
                         save_text(diff, diff_path)
                         result["diff_path"] = str(diff_path)
             
@@ -140,6 +166,42 @@ class PRAnalyzer:
             result["error"] = str(e)
             return result
     
+    def _get_completion(self, prompt: str, model: Optional[str] = None) -> str:
+        """
+        Get the completion for a prompt, using the response cache when possible
+        
+        Args:
+            prompt: Prompt to send to the provider
+            model: Model to use (default: the provider's configured model)
+            
+        Returns:
+            str: Completion text
+        """
+        model = model or self.provider.model
+        if self.response_cache is None:
+            return self.provider.get_completion(prompt, model=model)
+        
+        cache_key = self.response_cache.make_key(
+            prompt,
+            provider=self.provider.__class__.__name__,
+            base_url=self.provider.base_url,
+            model=model,
+            temperature=self.provider.temperature,
+            max_tokens=self.provider.max_tokens
+        )
+        
+        analysis = self.response_cache.get(cache_key)
+        if analysis is not None and analysis.strip():
+            logger.info("Using cached analysis for an identical prompt")
+            return analysis
+        
+        analysis = self.provider.get_completion(prompt, model=model)
+        
+        # Never reuse an empty completion
+        if analysis.strip():
+            self.response_cache.set(cache_key, analysis)
+        return analysis
+    
     def analyze_pr_from_file(self, json_file_path: Union[str, Path], language: str = "en",
                             output_dir: Optional[Path] = None, save_diff: bool = False,
                             dry_run: bool = False, save_prompt: bool = False) -> Dict[str, Any]:
@@ -194,14 +256,154 @@ class PRAnalyzer:
         if not output_dir:
             output_dir = config_manager.get_output_dir()
         
+        # Load the latest PR data and analyze it
+        pr_data = self.load_pr_data(repo, pr_number, output_dir)
+        return self.analyze_pr(pr_data, language, output_dir, save_diff, dry_run, save_prompt)
+    
+    def analyze_prs_from_files(self, json_file_paths: List[Union[str, Path]], language: str = "en",
+                               output_dir: Optional[Path] = None, save_diff: bool = False,
+                               dry_run: bool = False, save_prompt: bool = False,
+                               max_workers: int = 4,
+                               checkpoint_file: Optional[Union[str, Path]] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze several PRs from JSON files concurrently
+        
+        The LLM requests dominate the run time and are independent of each other,
+        so they are overlapped on a bounded thread pool.
+        
+        Args:
+            json_file_paths: Paths to PR JSON files
+            language: Output language code
+            output_dir: Output directory (optional)
+            save_diff: Whether to save PR diff as a separate file
+            dry_run: If True, don't actually call LLM API
+            save_prompt: Whether to save the LLM prompt
+            max_workers: Maximum number of concurrent analyses (default: 4)
+            checkpoint_file: JSONL file recording completed analyses (optional). PRs
+                recorded there with an existing report are skipped, so an interrupted
+                batch can be resumed.
+            
+        Returns:
+            list: Analysis results in input order, failed analyses carry an 'error' key
+                and skipped analyses a 'skipped' key
+        """
+        completed = self._load_checkpoint(checkpoint_file, language) if checkpoint_file else {}
+        checkpoint_lock = threading.Lock()
+        
+        def analyze(json_file_path: Union[str, Path]) -> Dict[str, Any]:
+            if str(json_file_path) in completed:
+                logger.info(f"Skipping {json_file_path}, already analyzed in {completed[str(json_file_path)]}")
+                return {
+                    "json_file": str(json_file_path),
+                    "analysis_path": completed[str(json_file_path)],
+                    "skipped": True
+                }
+            
+            try:
+                result = self.analyze_pr_from_file(json_file_path, language, output_dir,
+                                                   save_diff, dry_run, save_prompt)
+            except Exception as e:
+                logger.error(f"Error analyzing PR from {json_file_path}: {e}")
+                return {"json_file": str(json_file_path), "error": str(e)}
+            
+            if checkpoint_file and "analysis_path" in result and "error" not in result:
+                record = {
+                    "json_file": str(json_file_path),
+                    "repository": result["repository"],
+                    "pr_number": result["pr_number"],
+                    "language": language,
+                    "analysis_path": result["analysis_path"]
+                }
+                with checkpoint_lock:
+                    self._append_checkpoint(checkpoint_file, record)
+            
+            return result
+        
+        if not json_file_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(json_file_paths)))) as executor:
+            return list(executor.map(analyze, json_file_paths))
+    
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: Union[str, Path], language: str) -> Dict[str, str]:
+        """
+        Load the analyses recorded in a checkpoint file
+        
+        Args:
+            checkpoint_file: JSONL checkpoint file
+            language: Output language code of the current batch
+            
+        Returns:
+            dict: Mapping of PR JSON file paths to their report paths, only reports
+                in the given language that still exist are included
+        """
+        completed = {}
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines(keepends=True)
+        except FileNotFoundError:
+            return completed
+        
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A crash can leave a truncated last line
+                continue
+            
+            if record.get("language") == language and os.path.exists(record.get("analysis_path", "")):
+                completed[record["json_file"]] = record["analysis_path"]
+        
+        # Terminate a truncated last line, so new records start on a line of their own
+        if lines and not lines[-1].endswith("\n"):
+            with open(checkpoint_file, 'a', encoding='utf-8') as f:
+                f.write("\n")
+        
+        return completed
+    
+    @staticmethod
+    def _append_checkpoint(checkpoint_file: Union[str, Path], record: Dict[str, Any]) -> None:
+        """
+        Append a completed analysis to a checkpoint file
+        
+        Args:
+            checkpoint_file: JSONL checkpoint file
+            record: Analysis record
+        """
+        with open(checkpoint_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            # Each record stands for a paid LLM request, make sure it survives a crash
+            os.fsync(f.fileno())
+    
+    def load_pr_data(self, repo: str, pr_number: Union[int, str],
+                     output_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Load the latest saved PR data for a repository and PR number
+        
+        Args:
+            repo: Repository name
+            pr_number: PR number
+            output_dir: Output directory (optional)
+            
+        Returns:
+            dict: PR data
+            
+        Raises:
+            FileNotFoundError: If no PR JSON file is found
+        """
+        # Use output directory from config if not provided
+        if not output_dir:
+            output_dir = config_manager.get_output_dir()
+        
         # Find PR JSON file
         pr_json_file = self._find_pr_json_file(output_dir, repo, pr_number)
         
         if not pr_json_file:
             raise FileNotFoundError(f"PR JSON file not found for {repo}#{pr_number}")
         
-        # Analyze PR from file
-        return self.analyze_pr_from_file(pr_json_file, language, output_dir, save_diff, dry_run, save_prompt)
+        return load_json(pr_json_file)
     
     def _find_pr_json_file(self, base_dir: Path, repo: str, pr_number: Union[int, str]) -> Optional[Path]:
         """
@@ -218,24 +420,7 @@ class PRAnalyzer:
         # Extract repo name from owner/repo format
         repo_name = repo.split('/')[-1]
         
-        # Look in all month directories
-        repo_dir = base_dir / repo_name
-        if not repo_dir.exists():
-            return None
-        
-        # Find all month directories
-        month_dirs = [d for d in repo_dir.iterdir() if d.is_dir()]
-        
-        # Search each month directory from newest to oldest
-        for month_dir in sorted(month_dirs, reverse=True):
-            # Look for PR JSON files
-            json_files = list(month_dir.glob(f"pr_{pr_number}_*.json"))
-            
-            if json_files:
-                # Sort by file modification time, newest first
-                return sorted(json_files, key=lambda x: x.stat().st_mtime, reverse=True)[0]
-        
-        return None
+        return find_latest_pr_json(base_dir / repo_name, pr_number)
 
 def parse_arguments():
     """
@@ -11,6 +11,7 @@ import sys
 import os
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Union
@@ -52,11 +53,12 @@ class PRFetcher:
         logger.info(f"Fetching PR information for {repo}#{pr_number}")
         
         try:
-            # Fetch basic PR info
-            pr_data = self.github_client.fetch_pr_info(repo, pr_number)
-            
-            # Fetch PR diff
-            pr_data["diff"] = self.github_client.fetch_pr_diff(repo, pr_number)
+            # Fetch basic PR info and the PR diff concurrently, the two gh calls are independent
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                info_future = executor.submit(self.github_client.fetch_pr_info, repo, pr_number)
+                diff_future = executor.submit(self.github_client.fetch_pr_diff, repo, pr_number)
+                pr_data = info_future.result()
+                pr_data["diff"] = diff_future.result()
             
             # Add metadata
             pr_data["fetched_at"] = datetime.now().isoformat()
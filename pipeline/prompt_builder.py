@@ -6,10 +6,14 @@ Prompt Builder for PRhythm.
 This module handles the construction of prompts for LLM analysis of PRs.
 """
 
+import heapq
 import logging
 import os
+import string
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 from utils.languages import get_language_name
 from utils.file_utils import read_text
@@ -17,6 +21,36 @@ from utils.file_utils import read_text
 # Setup logger
 logger = logging.getLogger("prompt_builder")
 
+# Project directory holding the bundled .prompt templates
+PROMPT_DIR = Path(os.path.dirname(os.path.abspath(__file__))).parent / "prompt"
+
+@lru_cache(maxsize=8)
+def _read_template_file(template_path: str, mtime_ns: int) -> str:
+    """
+    Read a prompt template, cached per path and modification time
+    
+    Args:
+        template_path: Path to the template file
+        mtime_ns: Modification time of the file, part of the cache key
+        
+    Returns:
+        str: Prompt template
+    """
+    return read_text(template_path)
+
+@lru_cache(maxsize=8)
+def _template_fields(template: str) -> frozenset:
+    """
+    Get the placeholder names referenced by a prompt template
+    
+    Args:
+        template: Prompt template
+        
+    Returns:
+        frozenset: Placeholder names
+    """
+    return frozenset(field for _, field, _, _ in string.Formatter().parse(template) if field)
+
 class PromptBuilder:
     """
     Builds prompts for LLM analysis of PRs.
@@ -56,18 +90,21 @@ class PromptBuilder:
             FileNotFoundError: If template file not found
         """
         # First try to load from prompt directory
-        prompt_path = Path(os.path.dirname(os.path.abspath(__file__))).parent / "prompt" / f"{template_name}.prompt"
+        prompt_path = PROMPT_DIR / f"{template_name}.prompt"
         
         # Then try project templates directory
         template_path = self.template_dir / f"{template_name}.txt"
         
-        if prompt_path.exists():
-            return read_text(prompt_path)
-        elif template_path.exists():
-            return read_text(template_path)
-        else:
-            # Template file is required
-            raise FileNotFoundError(f"Required template file not found at {prompt_path} or {template_path}")
+        # Reuse the loaded template until the file is modified
+        for path in (prompt_path, template_path):
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            return _read_template_file(str(path), mtime_ns)
+        
+        # Template file is required
+        raise FileNotFoundError(f"Required template file not found at {prompt_path} or {template_path}")
     
     def build_pr_analysis_prompt(self, pr_data: Dict[str, Any], language_code: str = "en") -> str:
         """
@@ -108,17 +145,29 @@ class PromptBuilder:
         if not pr_labels:
             pr_labels = "None"
         
-        # Prepare file changes summary
-        file_changes_summary = self._prepare_file_changes_summary(pr_data)
+        # Only build the derived sections the template actually references,
+        # their results would otherwise be discarded by format()
+        fields = _template_fields(template)
+        needs_summary = "FILE_CHANGES_SUMMARY" in fields
+        needs_architecture = "ARCHITECTURE_CONTEXT" in fields
+        
+        # Normalize file entries once for the file-based sections
+        files = self._index_files(pr_data) if needs_summary or needs_architecture else []
         
-        # Prepare architecture context
-        architecture_context = self._prepare_architecture_context(pr_data)
+        file_changes_summary = ""
+        if needs_summary:
+            file_changes_summary = self._prepare_file_changes_summary(files)
+        
+        architecture_context = ""
+        if needs_architecture:
+            architecture_context = self._prepare_architecture_context(files)
         
         # Prepare language context
         language_name = get_language_name(language_code)
         
-        # Prepare diff excerpt
-        diff_excerpt = self._prepare_diff_excerpt(pr_data)
+        diff_excerpt = ""
+        if "DIFF_EXCERPT" in fields:
+            diff_excerpt = self._prepare_diff_excerpt(pr_data)
         
         # Fill template
         prompt = template.format(
@@ -142,34 +191,46 @@ class PromptBuilder:
         
         return prompt
     
-    def _prepare_file_changes_summary(self, pr_data: Dict[str, Any]) -> str:
+    def _index_files(self, pr_data: Dict[str, Any]) -> List[Tuple[str, int, int, int]]:
         """
-        Prepare a summary of file changes for the prompt
+        Normalize the file entries of the PR data
+        
+        The GitHub CLI reports file names under 'path' while the REST API uses
+        'filename', so resolve the name and change counts once per file.
         
         Args:
             pr_data: PR data
             
         Returns:
-            str: Summary of file changes
+            list: (filename, additions, deletions, changes) tuples
         """
-        # Sort files by the sum of additions and deletions
-        sorted_files = sorted(
-            pr_data.get('files', []), 
-            key=lambda x: x.get('changes', x.get('additions', 0) + x.get('deletions', 0)), 
-            reverse=True
-        )
+        indexed_files = []
+        for file in pr_data.get('files', []):
+            filename = file.get('filename') or file.get('path') or ''
+            additions = file.get('additions', 0)
+            deletions = file.get('deletions', 0)
+            changes = file.get('changes', additions + deletions)
+            indexed_files.append((filename, additions, deletions, changes))
+        
+        return indexed_files
+    
+    def _prepare_file_changes_summary(self, files: List[Tuple[str, int, int, int]]) -> str:
+        """
+        Prepare a summary of file changes for the prompt
         
-        # Take the top 5 files
-        top_files = sorted_files[:5]
+        Args:
+            files: Normalized file entries from _index_files
+            
+        Returns:
+            str: Summary of file changes
+        """
+        # Take the top 5 files by the sum of additions and deletions
+        top_files = heapq.nlargest(5, files, key=lambda x: x[3])
         
         # Format the summary
         summary_lines = []
-        for file in top_files:
-            # Try different field names for filename
-            filename = file.get('filename', file.get('path', 'Unknown file'))
-            additions = file.get('additions', 0)
-            deletions = file.get('deletions', 0)
-            summary_lines.append(f"- `{filename}` (+{additions}/-{deletions})")
+        for filename, additions, deletions, _ in top_files:
+            summary_lines.append(f"- `{filename or 'Unknown file'}` (+{additions}/-{deletions})")
         
         # If no files found, add a note
         if not summary_lines:
@@ -177,41 +238,32 @@ class PromptBuilder:
         
         return "\n".join(summary_lines)
     
-    def _prepare_architecture_context(self, pr_data: Dict[str, Any]) -> str:
+    def _prepare_architecture_context(self, files: List[Tuple[str, int, int, int]]) -> str:
         """
         Prepare architecture context for the prompt
         
         Args:
-            pr_data: PR data
+            files: Normalized file entries from _index_files
             
         Returns:
             str: Architecture context
         """
-        # Extract file paths from PR data
-        file_paths = [file.get('filename', file.get('path', '')) for file in pr_data.get('files', [])]
-        
-        # Group files by directory to identify modules
-        modules = {}
-        for path in file_paths:
-            if not path:
-                continue
-            parts = path.split('/')
-            if len(parts) > 1:
-                module = parts[0]
-                if module not in modules:
-                    modules[module] = []
+        # Group files by top-level directory to identify modules
+        modules = defaultdict(list)
+        for path, _, _, _ in files:
+            module, separator, _ = path.partition('/')
+            if separator:
                 modules[module].append(path)
         
-        # Generate module summary
-        module_summary = []
-        for module, files in modules.items():
-            module_summary.append(f"- **{module}**: {len(files)} files modified")
-        
         # If no modules identified, provide a generic message
-        if not module_summary:
+        if not modules:
             return "No clear module structure identified from the PR changes."
         
-        return "The PR affects the following modules:\n" + "\n".join(module_summary)
+        # Generate module summary
+        return "The PR affects the following modules:\n" + "\n".join(
+            f"- **{module}**: {len(module_files)} files modified"
+            for module, module_files in modules.items()
+        )
     
     def _prepare_diff_excerpt(self, pr_data: Dict[str, Any], max_length: int = 2000) -> str:
         """
@@ -6,13 +6,29 @@ Base LLM provider for PRhythm.
 This module defines the base class for LLM providers.
 """
 
+import json
 import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson is optional, it handles large prompt payloads much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logger
 logger = logging.getLogger("base_provider")
 
+# HTTP status codes of transient failures that are worth retrying
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 class BaseProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -33,6 +49,23 @@ class BaseProvider(ABC):
         self.model = kwargs.get("model")
         self.max_tokens = kwargs.get("max_tokens", 4096)
         self.temperature = kwargs.get("temperature", 0.7)
+        self.stream = bool(kwargs.get("stream", False))
+        
+        # (connect, read) timeout in seconds, long generations need a generous read timeout
+        self.request_timeout = (kwargs.get("connect_timeout", 10), kwargs.get("timeout", 300))
+        
+        # Total seconds one completion may take across all retries, kept below the
+        # 600 second limit update_pr_reports puts on an analysis process
+        self.request_budget = kwargs.get("request_budget", 540)
+        
+        # Optional pacing of requests, shared by all threads using this provider
+        self.requests_per_minute = kwargs.get("requests_per_minute")
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_time = 0.0
+        
+        # Optional cheaper model for small PRs
+        self.small_model = kwargs.get("small_model")
+        self.small_model_max_changes = kwargs.get("small_model_max_changes", 100)
         
         # Additional configuration parameters
         self.additional_params = kwargs
@@ -82,6 +115,208 @@ class BaseProvider(ABC):
         """
         pass
     
+    def _create_session(self, headers: Dict[str, str]) -> requests.Session:
+        """
+        Create an HTTP session with pooled keep-alive connections
+        
+        Args:
+            headers: Headers to send with every request
+            
+        Returns:
+            requests.Session: Session with a pooled connection adapter
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(headers)
+        return session
+    
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Block until the next request may be sent under the configured rate limit
+        """
+        if not self.requests_per_minute:
+            return
+        
+        # Reserve the next slot under the lock, then sleep outside of it
+        interval = 60.0 / self.requests_per_minute
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + interval
+        
+        if request_time > now:
+            time.sleep(request_time - now)
+    
+    def _get_attempt_timeout(self, deadline: float) -> Tuple[float, float]:
+        """
+        Get the (connect, read) timeout of the next attempt within the request budget
+        
+        Args:
+            deadline: time.monotonic() value by which the completion must be done
+            
+        Returns:
+            tuple: (connect, read) timeout in seconds
+        """
+        connect_timeout, read_timeout = self.request_timeout
+        remaining = max(1.0, deadline - time.monotonic())
+        return min(connect_timeout, remaining), min(read_timeout, remaining)
+    
+    def _get_retry_delay(self, error: requests.exceptions.RequestException, attempt: int,
+                         retry_delay: float, max_delay: float = 30.0) -> Optional[float]:
+        """
+        Get the delay before retrying a failed request
+        
+        Args:
+            error: Exception raised by the request
+            attempt: Zero-based number of the failed attempt
+            retry_delay: Initial retry delay in seconds
+            max_delay: Maximum backoff delay in seconds (default: 30.0)
+            
+        Returns:
+            Optional[float]: Delay in seconds, or None if the error is not transient
+        """
+        response = getattr(error, 'response', None)
+        if response is not None:
+            if response.status_code not in RETRIABLE_STATUS_CODES:
+                return None
+            
+            # Honor the delay requested by the server
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    # HTTP-date form, fall back to backoff
+                    pass
+        elif not isinstance(error, (requests.exceptions.ConnectionError,
+                                    requests.exceptions.Timeout,
+                                    requests.exceptions.ChunkedEncodingError)):
+            return None
+        
+        # Exponential backoff with jitter, so concurrent workers do not retry in lockstep
+        return min(max_delay, retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.0)
+    
+    def _build_payload(self, content_key: str, content: Any, **kwargs) -> Dict[str, Any]:
+        """
+        Build an OpenAI-compatible request payload
+        
+        Args:
+            content_key: Payload key of the content ('prompt' or 'messages')
+            content: Prompt text or list of messages
+            **kwargs: Parameter overrides and additional parameters
+            
+        Returns:
+            dict: Request payload
+        """
+        # Start from the sampling parameters with any overrides applied
+        payload = {
+            "model": kwargs.pop("model", self.model),
+            content_key: content,
+            "temperature": kwargs.pop("temperature", self.temperature),
+            "max_tokens": kwargs.pop("max_tokens", self.max_tokens),
+            "top_p": kwargs.pop("top_p", 1.0),
+            "frequency_penalty": kwargs.pop("frequency_penalty", 0.0),
+            "presence_penalty": kwargs.pop("presence_penalty", 0.0)
+        }
+        
+        # Add any additional parameters without overriding the ones above
+        for key, value in kwargs.items():
+            payload.setdefault(key, value)
+        
+        return payload
+    
+    def _serialize_payload(self, payload: Dict[str, Any]) -> bytes:
+        """
+        Serialize a request payload to a JSON body
+        
+        Args:
+            payload: Request payload
+            
+        Returns:
+            bytes: UTF-8 encoded JSON body
+        """
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    
+    def _parse_response_json(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Parse the JSON body of a completed response
+        
+        Args:
+            response: Response of an API request
+            
+        Returns:
+            dict: Parsed response body
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _read_streamed_completion(self, response: requests.Response, endpoint: str,
+                                  deadline: Optional[float] = None) -> str:
+        """
+        Collect the completion text from a server-sent events response
+        
+        Args:
+            response: Streamed response of an OpenAI-compatible endpoint
+            endpoint: API endpoint the request was sent to
+            deadline: time.monotonic() value by which the stream must be complete (optional)
+            
+        Returns:
+            str: Completion text
+            
+        Raises:
+            requests.exceptions.ChunkedEncodingError: If the stream reports an error or
+                ends before the completion is finished, so the request is retried
+        """
+        pieces = []
+        finished = False
+        with response:
+            for line in response.iter_lines():
+                # Skip keep-alive blank lines and SSE comments
+                if not line.startswith(b"data:"):
+                    continue
+                
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    finished = True
+                    break
+                
+                chunk = orjson.loads(data) if orjson is not None else json.loads(data)
+                if chunk.get("error"):
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Error event in streamed completion: {chunk['error']}"
+                    )
+                
+                choices = chunk.get("choices") or [{}]
+                if endpoint == "chat/completions":
+                    content = (choices[0].get("delta") or {}).get("content")
+                else:
+                    content = choices[0].get("text")
+                
+                if content:
+                    pieces.append(content)
+                
+                if choices[0].get("finish_reason"):
+                    finished = True
+                
+                # The read timeout only bounds the gap between chunks, bound the whole stream too
+                if not finished and deadline is not None and time.monotonic() > deadline:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        "Streamed completion exceeded the request budget"
+                    )
+        
+        # A dropped connection must not pass for a complete (and then cached) report
+        if not finished:
+            raise requests.exceptions.ChunkedEncodingError(
+                "Streamed completion ended before it was finished"
+            )
+        
+        return "".join(pieces)
+    
     def validate_configuration(self) -> bool:
         """
         Validate the provider configuration
@@ -114,6 +349,20 @@ class BaseProvider(ABC):
             "temperature": self.temperature
         }
     
+    def select_model(self, total_changes: int) -> str:
+        """
+        Select the model to use for a PR of the given size
+        
+        Args:
+            total_changes: Number of changed lines in the PR
+            
+        Returns:
+            str: The small model if configured and the PR is small enough, else the default model
+        """
+        if self.small_model and total_changes <= self.small_model_max_changes:
+            return self.small_model
+        return self.model
+    
     def get_model_name(self) -> str:
         """
         Get the provider model name
@@ -39,6 +39,9 @@ class OpenAIProvider(BaseProvider):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        
+        # Reuse connections across requests
+        self.session = self._create_session(self.headers)
     
     def get_completion(self, prompt: str, **kwargs) -> str:
         """
@@ -57,25 +60,8 @@ class OpenAIProvider(BaseProvider):
         if not self.validate_configuration():
             raise RuntimeError("OpenAI provider not properly configured")
         
-        # Override parameters with kwargs if provided
-        temperature = kwargs.get("temperature", self.temperature)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
-        
         # Prepare request payload
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "top_p": kwargs.get("top_p", 1.0),
-            "frequency_penalty": kwargs.get("frequency_penalty", 0.0),
-            "presence_penalty": kwargs.get("presence_penalty", 0.0)
-        }
-        
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            if key not in payload and key not in ["temperature", "max_tokens"]:
-                payload[key] = value
+        payload = self._build_payload("prompt", prompt, **kwargs)
         
         # Make API request with retry
         return self._make_api_request("completions", payload)
@@ -97,38 +83,21 @@ class OpenAIProvider(BaseProvider):
         if not self.validate_configuration():
             raise RuntimeError("OpenAI provider not properly configured")
         
-        # Override parameters with kwargs if provided
-        temperature = kwargs.get("temperature", self.temperature)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
-        
         # Prepare request payload
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "top_p": kwargs.get("top_p", 1.0),
-            "frequency_penalty": kwargs.get("frequency_penalty", 0.0),
-            "presence_penalty": kwargs.get("presence_penalty", 0.0)
-        }
-        
-        # Add any additional parameters
-        for key, value in kwargs.items():
-            if key not in payload and key not in ["temperature", "max_tokens"]:
-                payload[key] = value
+        payload = self._build_payload("messages", messages, **kwargs)
         
         # Make API request with retry
         return self._make_api_request("chat/completions", payload)
     
     def _make_api_request(self, endpoint: str, payload: Dict[str, Any], 
-                          max_retries: int = 3, retry_delay: float = 2.0) -> str:
+                          max_retries: int = 5, retry_delay: float = 2.0) -> str:
         """
         Make API request to OpenAI with retry logic
         
         Args:
             endpoint: API endpoint (e.g., completions, chat/completions)
             payload: Request payload
-            max_retries: Maximum number of retries (default: 3)
+            max_retries: Maximum number of attempts (default: 5)
             retry_delay: Initial retry delay in seconds (default: 2.0)
             
         Returns:
@@ -139,14 +108,30 @@ class OpenAIProvider(BaseProvider):
         """
         url = f"{self.base_url}/{endpoint}"
         
+        # Ask for server-sent events when streaming is enabled
+        if self.stream:
+            payload = {**payload, "stream": True}
+        
+        # Serialize once, the same body is reused across retries
+        body = self._serialize_payload(payload)
+        
+        # Retries share one time budget, so the caller's own timeout is never hit first
+        deadline = time.monotonic() + self.request_budget
+        
         for attempt in range(max_retries):
             try:
                 logger.debug(f"Making OpenAI API request to {endpoint}")
-                response = requests.post(url, headers=self.headers, json=payload, timeout=60)
+                self._wait_for_rate_limit()
+                response = self.session.post(url, data=body, stream=self.stream,
+                                             timeout=self._get_attempt_timeout(deadline))
                 response.raise_for_status()
                 
+                # Streamed completions arrive as a sequence of delta chunks
+                if self.stream:
+                    return self._read_streamed_completion(response, endpoint, deadline)
+                
                 # Parse response
-                response_json = response.json()
+                response_json = self._parse_response_json(response)
                 
                 # Extract completion text based on endpoint
                 if endpoint == "chat/completions":
@@ -155,18 +140,16 @@ class OpenAIProvider(BaseProvider):
                     return response_json["choices"][0]["text"]
                 
             except requests.exceptions.RequestException as e:
-                # Handle rate limiting
-                if hasattr(e.response, 'status_code') and e.response.status_code == 429:
-                    retry_after = float(e.response.headers.get("retry-after", retry_delay * (attempt + 1)))
-                    logger.warning(f"Rate limited by OpenAI. Retrying after {retry_after} seconds")
-                    time.sleep(retry_after)
-                # Handle other errors
-                elif attempt < max_retries - 1:
-                    wait_time = retry_delay * (2 ** attempt)
-                    logger.warning(f"OpenAI API request failed: {e}. Retrying in {wait_time} seconds...")
+                # Only rate limits, server errors and connection failures are retried
+                wait_time = self._get_retry_delay(e, attempt, retry_delay)
+                if wait_time is not None and time.monotonic() + wait_time >= deadline:
+                    logger.warning(f"OpenAI request budget of {self.request_budget} seconds exhausted")
+                    wait_time = None
+                if wait_time is not None and attempt < max_retries - 1:
+                    logger.warning(f"OpenAI API request failed: {e}. Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"OpenAI API request failed after {max_retries} attempts: {e}")
+                    logger.error(f"OpenAI API request failed after {attempt + 1} attempt(s): {e}")
                     if hasattr(e, 'response') and hasattr(e.response, 'text'):
                         logger.error(f"Response: {e.response.text}")
                     raise RuntimeError(f"Failed to get completion from OpenAI: {e}")
@@ -7,6 +7,7 @@ This module provides a factory for creating LLM provider instances.
 """
 
 import logging
+import os
 from typing import Dict, Any, Optional, Type
 
 from .base_provider import BaseProvider
@@ -96,18 +97,16 @@ def get_provider_from_config(config: Dict[str, Any]) -> BaseProvider:
     # Get provider name from config
     provider_name = llm_config.get("provider", "openai")
     
-    # Get provider-specific configuration
-    providers_config = llm_config.get("providers", {})
-    provider_config = providers_config.get(provider_name, {})
+    # Get provider-specific configuration, tolerating explicit nulls
+    providers_config = llm_config.get("providers") or {}
+    provider_config = providers_config.get(provider_name) or {}
     
-    # Get API key
-    api_key = provider_config.get("api_key", "")
-    
-    # Check for environment variables in system
-    if not api_key:
-        import os
-        env_var_name = f"{provider_name.upper()}_API_KEY"
-        api_key = os.environ.get(env_var_name, "")
+    # Get API key, falling back to the provider and generic environment variables
+    api_key = (
+        provider_config.get("api_key")
+        or os.environ.get(f"{provider_name.upper()}_API_KEY")
+        or os.environ.get("LLM_API_KEY", "")
+    )
     
     # Create provider parameters
     params = {
@@ -11,13 +11,15 @@ import os
 import sys
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
 from pr_analyzer import PRAnalyzer
 from utils.config_manager import config_manager
 from utils.file_utils import ensure_directory, save_text, read_text
-from utils.languages import get_language_name, get_supported_languages
+from utils.languages import get_language_name
 
 # Setup logger
 logger = logging.getLogger("report_generator")
@@ -27,15 +29,16 @@ class ReportGenerator:
     Generates and manages PR analysis reports.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, use_cache: bool = True):
         """
         Initialize report generator
         
         Args:
             config: Configuration dictionary (optional)
+            use_cache: Whether to reuse cached LLM responses (default: True)
         """
         self.config = config or config_manager.get_full_config()
-        self.pr_analyzer = PRAnalyzer(self.config)
+        self.pr_analyzer = PRAnalyzer(self.config, use_cache)
         
         # Get configured languages
         self.languages = config_manager.get_output_languages()
@@ -75,48 +78,97 @@ class ReportGenerator:
             "success": True
         }
         
-        # Generate report for each language
-        for language in languages:
-            try:
-                logger.info(f"Generating {language} report for {repo}#{pr_number}")
-                result = self.pr_analyzer.analyze_pr_from_repo(
-                    repo, 
-                    pr_number, 
-                    language, 
-                    output_dir, 
-                    save_diff,
-                    dry_run
-                )
-                
-                # Store result
-                results["languages"][language] = {
-                    "success": "error" not in result,
-                    "language_name": get_language_name(language)
-                }
-                
-                # Add file paths if available
-                if "analysis_path" in result:
-                    results["languages"][language]["analysis_path"] = result["analysis_path"]
-                
-                if "diff_path" in result:
-                    results["languages"][language]["diff_path"] = result["diff_path"]
-                
-                # Add error if present
-                if "error" in result:
-                    results["languages"][language]["error"] = result["error"]
-                    results["success"] = False
-                
-            except Exception as e:
-                logger.error(f"Error generating {language} report for {repo}#{pr_number}: {e}")
+        # Load the PR data once, it is the same for every language
+        try:
+            pr_data = self.pr_analyzer.load_pr_data(repo, pr_number, output_dir)
+        except Exception as e:
+            logger.error(f"Error loading PR data for {repo}#{pr_number}: {e}")
+            for language in languages:
                 results["languages"][language] = {
                     "success": False,
                     "language_name": get_language_name(language),
                     "error": str(e)
                 }
-                results["success"] = False
+            results["success"] = False
+            return results
+        
+        # Name every language report after the same date, so they land in one month directory
+        timestamp = datetime.now()
+        
+        # Generate the language reports concurrently, each one is bound on its LLM request
+        with ThreadPoolExecutor(max_workers=min(8, len(languages)) or 1) as executor:
+            language_results = executor.map(
+                lambda language: self._generate_language_report(
+                    pr_data, repo, pr_number, language, output_dir, save_diff, dry_run, timestamp
+                ),
+                languages
+            )
+            
+            for language, language_result in zip(languages, language_results):
+                results["languages"][language] = language_result
+                if not language_result["success"]:
+                    results["success"] = False
         
         return results
     
+    def _generate_language_report(self, pr_data: Dict[str, Any], repo: str,
+                                  pr_number: Union[int, str], language: str,
+                                  output_dir: Path, save_diff: bool,
+                                  dry_run: bool, timestamp: datetime) -> Dict[str, Any]:
+        """
+        Generate the PR analysis report for a single language
+        
+        Args:
+            pr_data: PR data
+            repo: Repository name
+            pr_number: PR number
+            language: Language code
+            output_dir: Output directory
+            save_diff: Whether to save PR diff as a separate file
+            dry_run: If True, don't actually call LLM API
+            timestamp: Date used to name the report files
+            
+        Returns:
+            dict: Language result
+        """
+        try:
+            logger.info(f"Generating {language} report for {repo}#{pr_number}")
+            result = self.pr_analyzer.analyze_pr(
+                pr_data, 
+                language, 
+                output_dir, 
+                save_diff,
+                dry_run,
+                timestamp=timestamp
+            )
+            
+            # Store result
+            language_result = {
+                "success": "error" not in result,
+                "language_name": get_language_name(language)
+            }
+            
+            # Add file paths if available
+            if "analysis_path" in result:
+                language_result["analysis_path"] = result["analysis_path"]
+            
+            if "diff_path" in result:
+                language_result["diff_path"] = result["diff_path"]
+            
+            # Add error if present
+            if "error" in result:
+                language_result["error"] = result["error"]
+            
+            return language_result
+            
+        except Exception as e:
+            logger.error(f"Error generating {language} report for {repo}#{pr_number}: {e}")
+            return {
+                "success": False,
+                "language_name": get_language_name(language),
+                "error": str(e)
+            }
+    
     def generate_multilingual_report(self, repo: str, pr_number: Union[int, str],
                                     languages: Optional[List[str]] = None,
                                     output_dir: Optional[Path] = None,
@@ -225,7 +277,7 @@ class ReportGenerator:
             raise FileNotFoundError(f"No month directories found for {repo}")
         
         # Use latest month directory
-        latest_month_dir = sorted(month_dirs)[-1]
+        latest_month_dir = max(month_dirs)
         
         # Generate filename
         filename = f"pr_{pr_number}_multilingual.md"
@@ -248,6 +300,7 @@ def parse_arguments():
     parser.add_argument('--save-diff', action='store_true', help='Save PR diff as a separate file')
     parser.add_argument('--multilingual', action='store_true', help='Generate a combined multilingual report')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode (don\'t actually call LLM API)')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the LLM API instead of reusing cached responses')
     
     return parser.parse_args()
 
@@ -266,7 +319,7 @@ def main():
     
     try:
         # Initialize report generator
-        report_generator = ReportGenerator()
+        report_generator = ReportGenerator(use_cache=not args.no_cache)
         
         # Set output directory
         output_dir = None
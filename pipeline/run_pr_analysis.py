@@ -11,6 +11,8 @@ Features:
 - Save the PR diff as a separate patch file (using --save-diff flag)
 - Analyze codebase architecture and impact of changes
 - Extract learning points from the PR
+- Analyze several PR JSON files concurrently (pass multiple paths to --json)
+- Resume an interrupted batch from a checkpoint file (using --checkpoint flag)
 """
 
 import sys
@@ -37,7 +39,7 @@ def parse_arguments():
     
     # PR identification (either repo+pr or json)
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument('--json', help='Path to PR JSON file')
+    group.add_argument('--json', nargs='+', help='Path to PR JSON file, several paths are analyzed concurrently')
     group.add_argument('--repo', help='Repository in owner/repo format')
     
     # If using --repo, PR number is required
@@ -51,6 +53,9 @@ def parse_arguments():
     parser.add_argument('--provider', help='LLM provider to use (overrides config)')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode (don\'t actually call LLM API)')
     parser.add_argument('--save-prompt', action='store_true', help='Save the full LLM prompt to a file in the logs directory')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the LLM API instead of reusing cached responses')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum number of PRs analyzed at once with several --json paths (default: 4)')
+    parser.add_argument('--checkpoint', help='JSONL file recording completed analyses with several --json paths, PRs already recorded are skipped when the batch is rerun')
     
     args = parser.parse_args()
     
@@ -75,18 +80,43 @@ def main():
     
     try:
         # Initialize PR analyzer
-        analyzer = PRAnalyzer()
+        analyzer = PRAnalyzer(use_cache=not args.no_cache)
         
         # Set output directory
         output_dir = None
         if args.output_dir:
             output_dir = Path(args.output_dir)
         
+        # Analyze several PRs concurrently
+        if args.json and len(args.json) > 1:
+            results = analyzer.analyze_prs_from_files(
+                args.json,
+                args.language,
+                output_dir,
+                args.save_diff,
+                args.dry_run,
+                args.save_prompt,
+                args.concurrency,
+                args.checkpoint
+            )
+            
+            failed = [result for result in results if "error" in result]
+            for result in results:
+                if "analysis_path" in result:
+                    logger.info(f"Analysis saved to: {result['analysis_path']}")
+            
+            if failed:
+                logger.error(f"{len(failed)} of {len(results)} analyses failed")
+                sys.exit(1)
+            
+            logger.info(f"Analysis of {len(results)} PRs completed successfully")
+            return
+        
         # Analyze PR
         result = None
         if args.json:
             result = analyzer.analyze_pr_from_file(
-                args.json, 
+                args.json[0], 
                 args.language, 
                 output_dir, 
                 args.save_diff,
@@ -12,6 +12,7 @@ import argparse
 import requests
 from pathlib import Path
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 # Import common utilities
 from common import (
@@ -31,6 +32,10 @@ logger = setup_logging("track_merged_prs")
 # if you encounter rate limiting problems
 GITHUB_API_BASE = "https://api.github.com"
 
+# Shared session, keeps the GitHub API connection alive across repositories
+GITHUB_SESSION = requests.Session()
+GITHUB_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 def get_status_file_path(project_root, config):
     """
     Get the path to the status file
@@ -120,7 +125,7 @@ def get_merged_prs(repo, token=None, limit=10):
     url = f"{GITHUB_API_BASE}/repos/{repo}/pulls?state=closed&sort=updated&direction=desc&per_page={limit}"
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = GITHUB_SESSION.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         
         # Filter to only merged PRs
@@ -26,7 +26,6 @@ Usage:
 
 import sys
 import re
-import glob
 import argparse
 import importlib.util
 from pathlib import Path
@@ -34,6 +33,9 @@ from datetime import datetime
 import time
 import os
 import csv
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import common utilities
 from common import (
@@ -43,10 +45,18 @@ from common import (
     run_command,
     ensure_directory
 )
+from utils.file_utils import find_latest_pr_json
 
 # Setup logger
 logger = setup_logging("update_pr_reports")
 
+# Patterns for parsing the output of the pipeline scripts
+PR_LINE_PATTERN = re.compile(r'^#(\d+) - ')
+REPORT_PATH_PATTERN = re.compile(r"Saved analysis report: (.+\.md)")
+
+# Guards the failed LLM requests log, which is appended to from several threads
+FAILED_REQUESTS_LOCK = threading.Lock()
+
 def parse_arguments():
     """
     Parse command line arguments
@@ -142,8 +152,6 @@ def run_script(script_path, *args, timeout=600):
     Returns:
         tuple: (return_code, stdout, stderr)
     """
-    import subprocess
-    
     cmd = [sys.executable, str(script_path)] + list(args)
     try:
         process = subprocess.Popen(
@@ -190,7 +198,7 @@ def extract_pr_numbers(output):
     """
     pr_numbers = []
     for line in output.splitlines():
-        match = re.match(r'^#(\d+) - ', line)
+        match = PR_LINE_PATTERN.match(line)
         if match:
             pr_numbers.append(match.group(1))
     return pr_numbers
@@ -214,26 +222,9 @@ def find_pr_json_file(repo_name, pr_number, config):
     if output_base_dir.startswith('./'):
         output_base_dir = output_base_dir[2:]
     
-    # Get current year-month
-    current_month = datetime.now().strftime("%Y-%m")
-    
-    # First search in the monthly directory
-    monthly_pattern = f"{output_base_dir}/{repo_name}/{current_month}/pr_{pr_number}_*.json"
-    monthly_files = glob.glob(monthly_pattern)
-    
-    if monthly_files:
-        # Sort by modification time (newest first)
-        return sorted(monthly_files, key=lambda f: Path(f).stat().st_mtime, reverse=True)[0]
-    
-    # If not found in monthly directory, search in main directory
-    main_pattern = f"{output_base_dir}/{repo_name}/pr_{pr_number}_*.json"
-    main_files = glob.glob(main_pattern)
-    
-    if main_files:
-        # Sort by modification time (newest first)
-        return sorted(main_files, key=lambda f: Path(f).stat().st_mtime, reverse=True)[0]
-    
-    return None
+    # Search the month directories, newest first, then the repository directory
+    json_file = find_latest_pr_json(Path(output_base_dir) / repo_name, pr_number)
+    return str(json_file) if json_file else None
 
 def record_failed_request(repo, pr_number, language, error_message):
     """
@@ -257,21 +248,131 @@ def record_failed_request(repo, pr_number, language, error_message):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     record = [timestamp, repo, pr_number, language, error_message]
     
-    # Check if file exists, if not create and add header
-    file_exists = os.path.isfile(failed_requests_file)
-    
     try:
-        with open(failed_requests_file, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            # If file doesn't exist, write header first
-            if not file_exists:
-                writer.writerow(['Timestamp', 'Repository', 'PR Number', 'Language', 'Error'])
-            # Write the failure record
-            writer.writerow(record)
+        # Languages are analyzed concurrently, serialize writers of the shared file
+        with FAILED_REQUESTS_LOCK:
+            # Check if file exists, if not create and add header
+            file_exists = os.path.isfile(failed_requests_file)
+            
+            with open(failed_requests_file, mode='a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                # If file doesn't exist, write header first
+                if not file_exists:
+                    writer.writerow(['Timestamp', 'Repository', 'PR Number', 'Language', 'Error'])
+                # Write the failure record
+                writer.writerow(record)
         logger.info(f"Recorded failed LLM request for PR #{pr_number} in {language} to {failed_requests_file}")
     except Exception as e:
         logger.error(f"Failed to record failed LLM request: {str(e)}")
 
+def prepare_analysis_dir(project_root, config):
+    """
+    Resolve and create the analysis directory from configuration
+    
+    Args:
+        project_root: Project root directory
+        config: Configuration dictionary
+        
+    Returns:
+        Path: Analysis directory
+    """
+    analysis_base_dir = config.get('paths', {}).get('analysis_dir', './analysis')
+    analysis_dir = project_root / analysis_base_dir.lstrip('./')
+    
+    try:
+        # Resolve once, this also follows the symlink used in the Docker environment
+        analysis_dir = analysis_dir.resolve(strict=False)
+        
+        # Check if path exists but is not a directory
+        if analysis_dir.exists() and not analysis_dir.is_dir():
+            logger.warning("Path %s exists but is not a directory. Removing it...", analysis_dir)
+            os.remove(analysis_dir)
+        
+        # Create the directory
+        os.makedirs(analysis_dir, exist_ok=True)
+    except Exception as e:
+        logger.error("Error handling analysis directory: %s", str(e))
+        # Fallback to a directory we know should work in Docker
+        analysis_dir = Path("/tmp/prhythm_analysis")
+        os.makedirs(analysis_dir, exist_ok=True)
+        logger.warning("Using fallback analysis directory: %s", analysis_dir)
+    
+    logger.info("Using analysis directory: %s", analysis_dir)
+    return analysis_dir
+
+def analyze_pr_language(analyze_pr_script, config_path, repo, pr_number, pr_json,
+                        output_language, provider):
+    """
+    Analyze a PR and generate its report in one language, retrying timeouts
+    
+    Args:
+        analyze_pr_script: Path to run_pr_analysis.py
+        config_path: Path to the configuration file
+        repo: Repository name
+        pr_number: PR number
+        pr_json: Path to the PR JSON file
+        output_language: Output language code
+        provider: LLM provider name (for logging)
+        
+    Returns:
+        bool: True if the report was generated, False otherwise
+    """
+    logger.info("6. Analyzing PR #%s and generating report in %s language using %s provider...", 
+               pr_number, output_language, provider)
+    # Run analyze_pr.py with explicit config path
+    max_retries = 2  # Maximum retry attempts
+    retry_count = 0
+    execute_success = False
+    
+    while retry_count <= max_retries and not execute_success:
+        if retry_count > 0:
+            logger.info("Retry attempt %d for PR #%s in %s language...", 
+                        retry_count, pr_number, output_language)
+        
+        returncode, stdout, stderr = run_script(
+            analyze_pr_script, 
+            "--json", pr_json, 
+            "--language", output_language,
+            "--config", str(config_path),
+            "--save-diff"
+        )
+        
+        # Check if execution was successful
+        if returncode == 0:
+            execute_success = True
+        # Check if it's a timeout error
+        elif "timed out" in stderr.lower():
+            retry_count += 1
+            if retry_count <= max_retries:
+                logger.warning("LLM request timed out. Retrying (%d/%d)...", 
+                               retry_count, max_retries)
+                # Add a short delay before retrying
+                time.sleep(3)
+            else:
+                logger.error("LLM request timed out after %d retries. Giving up.", max_retries)
+                # Record the failed request information
+                record_failed_request(repo, pr_number, output_language, f"Timeout after {max_retries} retries")
+                break
+        else:
+            # Other errors, no retry
+            logger.error("Failed to analyze PR with error: %s", stderr)
+            # Record the failed request information
+            record_failed_request(repo, pr_number, output_language, stderr)
+            break
+    
+    # Check if analysis was successful
+    if execute_success:
+        # Extract the saved report path from stdout
+        report_path_match = REPORT_PATH_PATTERN.search(stdout)
+        
+        if report_path_match:
+            report_path = report_path_match.group(1)
+            logger.info("Generated report saved to: %s", report_path)
+    else:
+        logger.error("Failed to analyze PR #%s in %s language: %s", pr_number, output_language, stderr)
+    
+    return execute_success
+
 def update_pr_reports():
     """Process PR reports update workflow"""
     # Get project root directory
@@ -307,6 +408,10 @@ def update_pr_reports():
     # Get default provider from config
     default_provider = get_provider_from_config(config)
     
+    # Prepare the analysis directory once for all repositories and languages
+    prepare_analysis_dir(project_root, config)
+    analyze_pr_script = project_root / "pipeline" / "run_pr_analysis.py"
+    
     # Process each repository
     for repo in repositories:
         logger.info("===== Processing repository: %s =====", repo)
@@ -355,101 +460,17 @@ def update_pr_reports():
             
             logger.info("Found PR information file: %s", pr_json)
             
-            # 6. Analyze PR using configured language and provider
-            analysis_success = True
-            for output_language in output_languages:
-                logger.info("6. Analyzing PR #%s and generating report in %s language using %s provider...", 
-                           pr_number, output_language, default_provider)
-                analyze_pr_script = project_root / "pipeline" / "run_pr_analysis.py"
-                
-                # Get analysis directory from config
-                analysis_base_dir = config.get('paths', {}).get('analysis_dir', './analysis')
-                
-                # Ensure analysis directory exists
-                analysis_dir = project_root / analysis_base_dir.lstrip('./')
-                
-                # Handle symlinks in Docker environment
-                try:
-                    # Check if it's a symlink
-                    if os.path.islink(analysis_dir):
-                        # Get the target of the symlink
-                        link_target = os.readlink(analysis_dir)
-                        logger.info("Analysis directory is a symlink pointing to: %s", link_target)
-                        
-                        # If relative path, make it absolute
-                        if not os.path.isabs(link_target):
-                            link_target = os.path.normpath(os.path.join(os.path.dirname(str(analysis_dir)), link_target))
-                        
-                        # Use the target directory instead
-                        analysis_dir = Path(link_target)
-                        logger.info("Using symlink target as analysis directory: %s", analysis_dir)
-                    
-                    # Check if path exists but is not a directory
-                    if os.path.exists(analysis_dir) and not os.path.isdir(analysis_dir):
-                        logger.warning("Path %s exists but is not a directory. Removing it...", analysis_dir)
-                        os.remove(analysis_dir)
-                    
-                    # Create the directory
-                    os.makedirs(analysis_dir, exist_ok=True)
-                except Exception as e:
-                    logger.error("Error handling analysis directory: %s", str(e))
-                    # Fallback to a directory we know should work in Docker
-                    analysis_dir = Path("/tmp/prhythm_analysis")
-                    os.makedirs(analysis_dir, exist_ok=True)
-                    logger.warning("Using fallback analysis directory: %s", analysis_dir)
-                
-                # Run analyze_pr.py with explicit config path
-                max_retries = 2  # Maximum retry attempts
-                retry_count = 0
-                execute_success = False
-                
-                while retry_count <= max_retries and not execute_success:
-                    if retry_count > 0:
-                        logger.info("Retry attempt %d for PR #%s in %s language...", 
-                                    retry_count, pr_number, output_language)
-                    
-                    returncode, stdout, stderr = run_script(
-                        analyze_pr_script, 
-                        "--json", pr_json, 
-                        "--language", output_language,
-                        "--config", str(config_path),
-                        "--save-diff"
-                    )
-                    
-                    # Check if execution was successful
-                    if returncode == 0:
-                        execute_success = True
-                    # Check if it's a timeout error
-                    elif "timed out" in stderr.lower():
-                        retry_count += 1
-                        if retry_count <= max_retries:
-                            logger.warning("LLM request timed out. Retrying (%d/%d)...", 
-                                           retry_count, max_retries)
-                            # Add a short delay before retrying
-                            time.sleep(3)
-                        else:
-                            logger.error("LLM request timed out after %d retries. Giving up.", max_retries)
-                            # Record the failed request information
-                            record_failed_request(repo, pr_number, output_language, f"Timeout after {max_retries} retries")
-                            break
-                    else:
-                        # Other errors, no retry
-                        logger.error("Failed to analyze PR with error: %s", stderr)
-                        # Record the failed request information
-                        record_failed_request(repo, pr_number, output_language, stderr)
-                        break
-                
-                # Check if analysis was successful
-                if execute_success:
-                    # Extract the saved report path from stdout
-                    report_path_match = re.search(r"Saved analysis report: (.+\.md)", stdout)
-                    
-                    if report_path_match:
-                        report_path = report_path_match.group(1)
-                        logger.info("Generated report saved to: %s", report_path)
-                else:
-                    logger.error("Failed to analyze PR #%s in %s language: %s", pr_number, output_language, stderr)
-                    analysis_success = False
+            # 6. Analyze PR using configured language and provider, the languages are
+            # independent and each one waits on its own LLM request, so run them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(output_languages))) as executor:
+                language_results = list(executor.map(
+                    lambda output_language: analyze_pr_language(
+                        analyze_pr_script, config_path, repo, pr_number, pr_json,
+                        output_language, default_provider
+                    ),
+                    output_languages
+                ))
+            analysis_success = all(language_results)
             
             # 7. Update processing status (after all languages are processed)
             logger.info("7. Updating PR processing status...")
@@ -6,12 +6,13 @@ Configuration manager for PRhythm.
 This module provides a centralized way to handle configuration across the project.
 """
 
-import json
 import os
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from utils.file_utils import get_project_root, load_json
+
 # Setup logger
 logger = logging.getLogger("config_manager")
 
@@ -50,8 +51,7 @@ class ConfigManager:
         path = Path(config_path)
         if not path.is_absolute():
             # Get project root directory
-            script_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            path = script_dir / path
+            path = get_project_root() / path
         return path
     
     def _load_config(self) -> Dict[str, Any]:
@@ -69,9 +69,7 @@ class ConfigManager:
                 logger.warning(f"Configuration file not found: {self.config_path}")
                 return {}
                 
-            with open(self.config_path, 'r') as file:
-                config = json.load(file)
-                return config
+            return load_json(self.config_path)
         except Exception as e:
             logger.error(f"Error reading configuration file: {e}")
             return {}
@@ -194,8 +192,7 @@ class ConfigManager:
         
         if not path.is_absolute():
             # Convert to absolute path relative to project root
-            script_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            path = script_dir / path_str
+            path = get_project_root() / path_str
             
         return path
     
@@ -226,6 +223,15 @@ class ConfigManager:
         """
         return self.get_path("analysis_dir", "./analysis")
     
+    def get_cache_dir(self) -> Path:
+        """
+        Get cache directory path
+        
+        Returns:
+            Path: Cache directory path
+        """
+        return self.get_path("cache_dir", "./.cache")
+    
     def get_full_config(self) -> Dict[str, Any]:
         """
         Get the full configuration
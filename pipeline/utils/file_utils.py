@@ -9,13 +9,27 @@ This module provides unified file operations used across the project.
 import json
 import os
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 
+# orjson is optional, it handles large PR data files much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logger
 logger = logging.getLogger("file_utils")
 
+# Month directories are named YYYY-MM
+MONTH_DIR_PATTERN = re.compile(r'^\d{4}-\d{2}$')
+
+# PR data files are named pr_<number>_<suffix>.json
+PR_JSON_PATTERN = re.compile(r'^pr_(\d+)_.*\.json$')
+
 def ensure_directory(directory_path: Union[str, Path]) -> Path:
     """
     Ensure that a directory exists, creating it if necessary
@@ -30,10 +44,13 @@ def ensure_directory(directory_path: Union[str, Path]) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
     return directory
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get project root directory
     
+    The result is computed once per process.
+    
     Returns:
         Path: Project root directory
     """
@@ -56,8 +73,18 @@ def save_json(data: Any, file_path: Union[str, Path], indent: int = 2) -> Path:
     ensure_directory(file_path.parent)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        # orjson only supports two-space indentation and native JSON types
+        content = None
+        if orjson is not None and indent == 2:
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        if content is None:
+            content = json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+        
+        with open(file_path, 'wb') as f:
+            f.write(content)
         logger.debug(f"Saved JSON data to {file_path}")
         return file_path
     except Exception as e:
@@ -80,8 +107,9 @@ def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     file_path = Path(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Read the raw bytes in one go, orjson parses UTF-8 without a decode step
+        raw = file_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.debug(f"Loaded JSON data from {file_path}")
         return data
     except FileNotFoundError:
@@ -106,8 +134,10 @@ def save_text(text: str, file_path: Union[str, Path]) -> Path:
     ensure_directory(file_path.parent)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(text)
+        # Encode once and hand the whole buffer to a single write
+        data = text.encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(data)
         logger.debug(f"Saved text to {file_path}")
         return file_path
     except Exception as e:
@@ -142,7 +172,7 @@ def read_text(file_path: Union[str, Path]) -> str:
 
 def generate_output_path(output_dir: Path, repo: str, pr_number: Union[int, str], 
                          extension: str = "json", language: Optional[str] = None,
-                         simple_name: bool = False) -> Path:
+                         simple_name: bool = False, timestamp: Optional[datetime] = None) -> Path:
     """
     Generate a standardized output file path
     
@@ -153,6 +183,8 @@ def generate_output_path(output_dir: Path, repo: str, pr_number: Union[int, str]
         extension: File extension without dot (default: 'json')
         language: Language code for reports (optional)
         simple_name: Whether to use simple naming format (pr_N.ext) without language and date
+        timestamp: Date for the month directory and file name (default: now), pass the
+            same value for related files to keep them together
         
     Returns:
         Path: Generated file path
@@ -160,8 +192,8 @@ def generate_output_path(output_dir: Path, repo: str, pr_number: Union[int, str]
     # Extract repo name from owner/repo format
     repo_name = repo.split('/')[-1]
     
-    # Get current date for month-based directory and naming
-    now = datetime.now()
+    # Get date for month-based directory and naming
+    now = timestamp or datetime.now()
     month_dir = now.strftime('%Y-%m')  # Format: YYYY-MM
     date_str = now.strftime('%Y%m%d')
     
@@ -190,16 +222,13 @@ def find_latest_file(directory: Union[str, Path], pattern: str) -> Optional[Path
     Returns:
         Optional[Path]: Path to the latest file or None if no files found
     """
-    directory = Path(directory)
-    if not directory.exists() or not directory.is_dir():
-        return None
-        
-    matching_files = list(directory.glob(pattern))
+    # glob() yields nothing for a missing directory, no need to stat it first
+    matching_files = list(Path(directory).glob(pattern))
     if not matching_files:
         return None
         
-    # Sort by modification time, newest first
-    return sorted(matching_files, key=lambda x: x.stat().st_mtime, reverse=True)[0]
+    # Pick the most recently modified file
+    return max(matching_files, key=lambda x: x.stat().st_mtime)
 
 def find_all_files(directory: Union[str, Path], pattern: str) -> list[Path]:
     """
@@ -212,8 +241,67 @@ def find_all_files(directory: Union[str, Path], pattern: str) -> list[Path]:
     Returns:
         list[Path]: List of matching file paths
     """
-    directory = Path(directory)
-    if not directory.exists() or not directory.is_dir():
-        return []
+    return list(Path(directory).glob(pattern))
+
+@lru_cache(maxsize=64)
+def _index_pr_json_files(directory: str, mtime_ns: int) -> Dict[str, str]:
+    """
+    Index the latest PR JSON file of each PR in a directory
+    
+    Args:
+        directory: Directory to index
+        mtime_ns: Modification time of the directory, part of the cache key
         
-    return list(directory.glob(pattern))
+    Returns:
+        dict: Mapping of PR numbers to the path of their latest JSON file
+    """
+    latest = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = PR_JSON_PATTERN.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+            
+            pr_number = match.group(1)
+            mtime = entry.stat().st_mtime
+            if pr_number not in latest or mtime > latest[pr_number][0]:
+                latest[pr_number] = (mtime, entry.path)
+    
+    return {pr_number: path for pr_number, (_, path) in latest.items()}
+
+def find_latest_pr_json(repo_dir: Union[str, Path], pr_number: Union[int, str]) -> Optional[Path]:
+    """
+    Find the latest PR JSON file for a given PR number
+    
+    Month directories are searched from newest to oldest, followed by the
+    repository directory itself. Each directory is scanned once and indexed
+    until its contents change.
+    
+    Args:
+        repo_dir: Repository output directory
+        pr_number: PR number
+        
+    Returns:
+        Optional[Path]: Path to the PR JSON file or None if not found
+    """
+    try:
+        with os.scandir(repo_dir) as entries:
+            month_dirs = sorted(
+                (entry.path for entry in entries
+                 if entry.is_dir(follow_symlinks=False) and MONTH_DIR_PATTERN.match(entry.name)),
+                reverse=True
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    
+    pr_number = str(pr_number)
+    for directory in month_dirs + [str(repo_dir)]:
+        try:
+            index = _index_pr_json_files(directory, os.stat(directory).st_mtime_ns)
+        except FileNotFoundError:
+            continue
+        
+        if pr_number in index:
+            return Path(index[pr_number])
+    
+    return None
@@ -47,4 +47,5 @@ def is_supported_language(language_code: str) -> bool:
     Returns:
         bool: True if language is supported, False otherwise
     """
-    return language_code in SUPPORTED_LANGUAGES
+    # Check against the map keys, a hash lookup rather than a list scan
+    return language_code in LANGUAGE_MAP
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Response cache for PRhythm.
+This module provides a disk-backed cache for LLM responses, so re-analyzing
+an unchanged PR does not repeat the LLM request.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from utils.file_utils import ensure_directory, read_text
+
+# Setup logger
+logger = logging.getLogger("response_cache")
+
+# Default time-to-live of cached responses (30 days)
+DEFAULT_TTL = 30 * 24 * 60 * 60
+
+class ResponseCache:
+    """
+    Disk-backed cache of LLM responses.
+    Entries are keyed by a hash of the request parameters and the prompt.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path], ttl: int = DEFAULT_TTL):
+        """
+        Initialize response cache
+        
+        Args:
+            cache_dir: Directory to store cached responses in
+            ttl: Time-to-live of cached responses in seconds (default: 30 days)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+    
+    @staticmethod
+    def make_key(prompt: str, **params: Any) -> str:
+        """
+        Compute the cache key of a request
+        
+        Args:
+            prompt: Prompt sent to the provider
+            **params: Request parameters that affect the response (provider, model, ...)
+        
+        Returns:
+            str: Hex digest identifying the request
+        """
+        # Trailing whitespace does not change the request, ignore it in the key
+        normalized_prompt = "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+        
+        digest = hashlib.sha256()
+        for name in sorted(params):
+            digest.update(f"{name}={params[name]}\n".encode("utf-8"))
+        digest.update(normalized_prompt.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        """
+        Get the file path of a cache entry
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Path: Path of the entry, sharded by the first two key characters
+        """
+        return self.cache_dir / key[:2] / f"{key}.md"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[str]: Cached response or None if missing or expired
+        """
+        path = self._entry_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                # Drop the expired entry
+                path.unlink()
+                return None
+            return read_text(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # A corrupt entry (e.g. not valid UTF-8) is treated as a miss
+            logger.warning(f"Error reading cached response {path}: {e}")
+            return None
+    
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response in the cache
+        
+        Failures are logged and ignored, caching must never fail an analysis.
+        
+        Args:
+            key: Cache key
+            response: Response text
+        """
+        path = self._entry_path(key)
+        tmp_path = None
+        try:
+            ensure_directory(path.parent)
+            
+            # Write to a temporary file and rename it, so concurrent readers
+            # never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(response.encode('utf-8'))
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error caching response to {path}: {e}")
+            
+            # Do not leave the partial temporary file behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
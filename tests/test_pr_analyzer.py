@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the PR analyzer.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# The pipeline modules import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pipeline"))
+
+from pr_analyzer import PRAnalyzer
+from utils.config_manager import config_manager
+
+class AnalyzePRTest(unittest.TestCase):
+    """
+    Tests for PRAnalyzer.analyze_pr
+    """
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp_dir.name)
+        
+        # Prompt logs are written relative to the working directory
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmp_path)
+        
+        config = {
+            "llm": {
+                "provider": "openai",
+                "providers": {"openai": {"api_key": "test", "model": "test-model"}},
+                "cache_ttl": 0
+            }
+        }
+        self.analyzer = PRAnalyzer(config, use_cache=False)
+        self.analyzer.provider.get_completion = mock.Mock(return_value="# Report\n")
+        
+        self.pr_data = {
+            "repository": "owner/repo",
+            "number": 42,
+            "title": "Fix a bug",
+            "files": [],
+            "diff": "diff --git a/x b/x\n"
+        }
+    
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp_dir.cleanup()
+    
+    def test_save_prompt_keeps_timestamp(self):
+        """
+        Saving the prompt must not replace the timestamp used to name the report
+        """
+        analysis_dir = self.tmp_path / "analysis"
+        timestamp = datetime(2024, 3, 5)
+        
+        with mock.patch.object(config_manager, "get_analysis_dir", return_value=analysis_dir):
+            result = self.analyzer.analyze_pr(self.pr_data, "en", output_dir=self.tmp_path,
+                                              save_diff=True, save_prompt=True, timestamp=timestamp)
+        
+        self.assertNotIn("error", result)
+        self.assertEqual(Path(result["analysis_path"]),
+                         analysis_dir / "repo" / "2024-03" / "pr_42_en_20240305.md")
+        self.assertEqual(Path(result["diff_path"]),
+                         analysis_dir / "repo" / "2024-03" / "pr_42.patch")
+        self.assertTrue(Path(result["analysis_path"]).exists())
+        self.assertEqual(len(list((self.tmp_path / "logs").glob("prompt_owner-repo_42_en_*.log"))), 1)
+
+if __name__ == "__main__":
+    unittest.main()
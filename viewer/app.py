@@ -25,6 +25,15 @@ import re
 
 app = Flask(__name__)
 
+# Pattern for month directories (YYYY-MM) inside a repository directory
+MONTH_DIR_PATTERN = re.compile(r'\d{4}-\d{2}')
+
+# Patterns for code fences in Markdown reports
+LEADING_MARKDOWN_FENCE_PATTERN = re.compile(r'^```markdown\s*\n')
+LANGUAGE_FENCE_PATTERN = re.compile(r'```(\w+)\s*\n')
+OPENING_FENCE_PATTERN = re.compile(r'```\w*\s*\n')
+CLOSING_FENCE_PATTERN = re.compile(r'```\s*\n')
+
 # Path to the analysis directory
 ANALYSIS_DIR = os.environ.get('ANALYSIS_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'analysis'))
 
@@ -111,16 +120,16 @@ def preprocess_markdown(content):
     Preprocess Markdown content to fix common issues with code blocks.
     """
     # Remove leading ```markdown if present at the beginning of the file
-    content = re.sub(r'^```markdown\s*\n', '', content)
+    content = LEADING_MARKDOWN_FENCE_PATTERN.sub('', content, count=1)
     
     # Fix code blocks with language specifiers
     # Replace ```rust\n with ```rust\n to ensure proper language detection
-    content = re.sub(r'```(\w+)\s*\n', r'```\1\n', content)
+    content = LANGUAGE_FENCE_PATTERN.sub(r'```\1\n', content)
     
     # Ensure code blocks are properly closed
     # Count opening and closing code fences
-    opens = len(re.findall(r'```\w*\s*\n', content))
-    closes = len(re.findall(r'```\s*\n', content))
+    opens = len(OPENING_FENCE_PATTERN.findall(content))
+    closes = len(CLOSING_FENCE_PATTERN.findall(content))
     
     # Add missing closing fences if needed
     if opens > closes:
@@ -149,7 +158,7 @@ def index():
                 
                 # Get repository name and month from path
                 repo_name = path_parts[0] if len(path_parts) > 0 else 'unknown'
-                month_dir = path_parts[1] if len(path_parts) > 1 and re.match(r'\d{4}-\d{2}', path_parts[1]) else None
+                month_dir = path_parts[1] if len(path_parts) > 1 and MONTH_DIR_PATTERN.match(path_parts[1]) else None
                 
                 files.append({
                     'path': rel_path,